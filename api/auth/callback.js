@@ -1,27 +1,35 @@
-import { createToken } from '../utils/auth.js';
+import { buildSessionCookie, clearOAuthStateCookie, createToken, consumeOAuthState } from '../utils/auth.js';
+import { getConfig } from '../utils/config.js';
 import { handleCors, sendError } from '../utils/response.js';
-import { githubApiRequest } from '../utils/github.js';
+import { githubApiRequest, githubFetch } from '../utils/github.js';
+
+const { clientId, clientSecret, redirectUri, frontendUrl } = getConfig();
+const DASHBOARD_URL = `${frontendUrl}/dashboard`;
+const SECURE_COOKIE = frontendUrl.startsWith('https://');
 
 export default async function handler(req, res) {
   if (handleCors(req, res)) return;
 
   try {
-    const { code } = req.query;
+    const { code, state } = req.query;
 
     if (!code) {
       return sendError(res, 400, 'Authorization code not provided');
     }
 
-    const clientId = process.env.GITHUB_CLIENT_ID;
-    const clientSecret = process.env.GITHUB_CLIENT_SECRET;
-    const redirectUri = process.env.GITHUB_REDIRECT_URI;
+    try {
+      consumeOAuthState(state, req);
+    } catch (error) {
+      res.setHeader('Set-Cookie', clearOAuthStateCookie(SECURE_COOKIE));
+      return sendError(res, 400, error.message);
+    }
 
     if (!clientId || !clientSecret) {
       return sendError(res, 500, 'GitHub OAuth not configured');
     }
 
     // Exchange code for access token
-    const tokenResponse = await fetch('https://github.com/login/oauth/access_token', {
+    const tokenResponse = await githubFetch('https://github.com/login/oauth/access_token', {
       method: 'POST',
       headers: {
         'Accept': 'application/json',
@@ -35,21 +43,40 @@ export default async function handler(req, res) {
       })
     });
 
+    // Only parse a body GitHub actually returned as JSON; error pages are HTML
+    if (!tokenResponse.ok) {
+      return sendError(res, 502, `GitHub token exchange failed: ${tokenResponse.status}`);
+    }
+
     const tokenData = await tokenResponse.json();
 
     if (tokenData.error) {
       return sendError(res, 400, tokenData.error_description || 'OAuth exchange failed');
     }
 
-    // Get user info using our GitHub utility
-    const user = await githubApiRequest('/user', tokenData.access_token);
+    // A fresh token is never seen again, so keep its response out of the ETag cache
+    const user = await githubApiRequest('/user', tokenData.access_token, { cache: 'no-store' });
+
+    // Keep a fixed set of fields: the full /user payload would otherwise ride
+    // along in every session token and be re-verified on each request
+    const sessionUser = {
+      id: user.id,
+      login: user.login,
+      name: user.name || null,
+      email: user.email || null,
+      avatar_url: user.avatar_url
+    };
 
     // Create JWT token
-    const token = createToken(user, tokenData.access_token);
+    const token = createToken(sessionUser, tokenData.access_token);
 
-    // Redirect to frontend with session
-    const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:3000';
-    res.redirect(`${frontendUrl}/dashboard?session=${token}`);
+    // Redirect to frontend; API calls authenticate via the HttpOnly session cookie,
+    // so the token never appears in a URL
+    res.setHeader('Set-Cookie', [
+      buildSessionCookie(token, SECURE_COOKIE),
+      clearOAuthStateCookie(SECURE_COOKIE)
+    ]);
+    res.redirect(DASHBOARD_URL);
     
   } catch (error) {
     sendError(res, 500, 'OAuth callback failed', error);
@@ -1,16 +1,24 @@
+import { buildOAuthStateCookie, createOAuthState } from '../utils/auth.js';
+import { getConfig } from '../utils/config.js';
 import { handleCors, sendError, sendSuccess } from '../utils/response.js';
 
+const { clientId, redirectUri, frontendUrl } = getConfig();
+const SECURE_COOKIE = frontendUrl.startsWith('https://');
+
+// Everything except the state is fixed per deployment, so build it once per instance
+const AUTHORIZE_URL_PREFIX = clientId && redirectUri
+  ? `https://github.com/login/oauth/authorize?client_id=${encodeURIComponent(clientId)}&redirect_uri=${encodeURIComponent(redirectUri)}&scope=repo,user&state=`
+  : null;
+
 export default async function handler(req, res) {
   if (handleCors(req, res)) return;
 
-  const clientId = process.env.GITHUB_CLIENT_ID;
-  const redirectUri = process.env.GITHUB_REDIRECT_URI;
-
-  if (!clientId || !redirectUri) {
+  if (!AUTHORIZE_URL_PREFIX) {
     return sendError(res, 500, 'GitHub OAuth not configured');
   }
 
-  const authUrl = `https://github.com/login/oauth/authorize?client_id=${clientId}&redirect_uri=${encodeURIComponent(redirectUri)}&scope=repo,user`;
+  const { state, nonce } = createOAuthState();
+  res.setHeader('Set-Cookie', buildOAuthStateCookie(nonce, SECURE_COOKIE));
 
-  sendSuccess(res, { auth_url: authUrl });
+  sendSuccess(res, { auth_url: AUTHORIZE_URL_PREFIX + state });
 }
\ No newline at end of file
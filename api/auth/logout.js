@@ -0,0 +1,18 @@
+import { clearSessionCookie } from '../utils/auth.js';
+import { getConfig } from '../utils/config.js';
+import { handleCors, sendError, sendSuccess } from '../utils/response.js';
+
+const SECURE_COOKIE = getConfig().frontendUrl.startsWith('https://');
+
+export default async function handler(req, res) {
+  if (handleCors(req, res)) return;
+
+  if (req.method !== 'POST') {
+    return sendError(res, 405, 'Method not allowed');
+  }
+
+  // Sessions are stateless JWTs; logging out means dropping the HttpOnly
+  // cookie, which only the server can remove
+  res.setHeader('Set-Cookie', clearSessionCookie(SECURE_COOKIE));
+  sendSuccess(res, { logged_out: true });
+}
\ No newline at end of file
@@ -1,6 +1,6 @@
 import { getSessionFromRequest } from '../utils/auth.js';
 import { asyncHandler, handleCors, sendSuccess } from '../utils/response.js';
-import { fetchAllPages } from '../utils/github.js';
+import { fetchAllPages, toRepositorySummary } from '../utils/github.js';
 
 export default asyncHandler(async (req, res) => {
   if (handleCors(req, res)) return;
@@ -14,5 +14,5 @@ export default asyncHandler(async (req, res) => {
     200 // Limit to 200 repos for performance
   );
   
-  sendSuccess(res, repositories);
+  sendSuccess(res, repositories.map(toRepositorySummary));
 });
\ No newline at end of file
@@ -1,5 +1,6 @@
-import { getSessionFromRequest } from '../../../../utils/auth.js';
-import { asyncHandler, handleCors, sendSuccess } from '../../../../utils/response.js';
+import { getOptionalSessionFromRequest } from '../../../../utils/auth.js';
+import { asyncHandler, handleCors, sendError, sendSuccess } from '../../../../utils/response.js';
+import { isLevelEnabled, logger } from '../../../../utils/logger.js';
 import { githubApiRequest, fetchCommits, fetchPullRequests, fetchIssues } from '../../../../utils/github.js';
 import { 
   extractContributors, 
@@ -8,37 +9,52 @@ import {
   analyzeFileTypes,
   generateActivityHeatmap,
   calculateQuarterlyInsights,
-  calculateRiskAssessment
+  calculateRiskAssessment,
+  selectTopCounts
 } from '../../../../utils/analysis.js';
 
+// Characters GitHub allows in user, organization and repository names
+// ('.' and '..' are reserved and would change the API path)
+const GITHUB_NAME_PATTERN = /^(?!\.\.?$)[A-Za-z0-9_.-]{1,100}$/;
+
+/**
+ * Fall back to an empty result when an optional fetch fails, except for
+ * failures that would fail every other fetch too (expired token, rate limit);
+ * those propagate so the client gets a 401/429 instead of an empty analysis
+ * @param {Promise} request - Pending fetch
+ * @param {string} label - Data name for the warning
+ * @param {any} fallback - Value to use when the fetch fails
+ * @returns {Promise<any>} Fetched data or the fallback
+ */
+function optionalFetch(request, label, fallback) {
+  return request.catch(error => {
+    if (error.message === 'GitHub token expired' || error.message === 'GitHub API rate limit exceeded') {
+      throw error;
+    }
+    logger.warn(`${label} fetch failed:`, error.message);
+    return fallback;
+  });
+}
+
 export default asyncHandler(async (req, res) => {
   if (handleCors(req, res)) return;
   
   const startTime = Date.now();
-  const { owner, repo, start_epoch, end_epoch, session_id } = req.query;
-  
-  console.log('Analysis request:', { owner, repo, hasSession: !!session_id });
+  const { owner, repo, start_epoch, end_epoch } = req.query;
   
   if (!owner || !repo) {
-    throw new Error('Owner and repository name required');
+    return sendError(res, 400, 'Owner and repository name required');
+  }
+  
+  if (!GITHUB_NAME_PATTERN.test(owner) || !GITHUB_NAME_PATTERN.test(repo)) {
+    return sendError(res, 400, 'Invalid owner or repository name');
   }
   
   // Get session if provided, otherwise this will work for public repos only
-  let session = null;
-  let accessToken = null;
+  const session = getOptionalSessionFromRequest(req);
+  const accessToken = session?.access_token ?? null;
   
-  if (session_id) {
-    try {
-      session = getSessionFromRequest(req);
-      accessToken = session.access_token;
-      console.log('Session validated for user:', session.user?.login);
-    } catch (error) {
-      console.error('Session validation error:', error);
-      throw new Error('Invalid session provided. Please log in again.');
-    }
-  } else {
-    console.log('No session provided, attempting public access');
-  }
+  logger.debug('Analysis request:', { owner, repo, user: session?.user?.login ?? null });
   
   // Build date range for filtering
   const dateRange = {
@@ -46,51 +62,30 @@ export default asyncHandler(async (req, res) => {
     until: end_epoch ? new Date(parseInt(end_epoch) * 1000).toISOString() : undefined
   };
   
-  console.log('Date range filtering:', {
-    start_epoch,
-    end_epoch,
-    since: dateRange.since,
-    until: dateRange.until
-  });
+  logger.debug('Date range filtering:', { start_epoch, end_epoch, ...dateRange });
   
   let repoData, languagesData, contentsData, commits, pullRequests, issues;
   
   try {
-    console.log('Fetching GitHub data for:', `${owner}/${repo}`);
-    
     // Fetch all data in parallel for optimal performance
     [repoData, languagesData, contentsData, commits, pullRequests, issues] = await Promise.all([
       githubApiRequest(`/repos/${owner}/${repo}`, accessToken),
-      githubApiRequest(`/repos/${owner}/${repo}/languages`, accessToken).catch(err => {
-        console.warn('Languages fetch failed:', err.message);
-        return {};
-      }),
-      githubApiRequest(`/repos/${owner}/${repo}/contents`, accessToken).catch(err => {
-        console.warn('Contents fetch failed:', err.message);
-        return [];
-      }),
-      fetchCommits(owner, repo, accessToken, dateRange).catch(err => {
-        console.warn('Commits fetch failed:', err.message);
-        return [];
-      }),
-      fetchPullRequests(owner, repo, accessToken, dateRange).catch(err => {
-        console.warn('Pull requests fetch failed:', err.message);
-        return [];
-      }),
-      fetchIssues(owner, repo, accessToken, dateRange).catch(err => {
-        console.warn('Issues fetch failed:', err.message);
-        return [];
-      })
+      optionalFetch(githubApiRequest(`/repos/${owner}/${repo}/languages`, accessToken), 'Languages', {}),
+      optionalFetch(githubApiRequest(`/repos/${owner}/${repo}/contents`, accessToken), 'Contents', []),
+      optionalFetch(fetchCommits(owner, repo, accessToken, dateRange), 'Commits', []),
+      optionalFetch(fetchPullRequests(owner, repo, accessToken, dateRange), 'Pull requests', []),
+      optionalFetch(fetchIssues(owner, repo, accessToken, dateRange), 'Issues', [])
     ]);
     
-    console.log('GitHub data fetched successfully');
-    console.log('Data counts:', {
-      commits: commits?.length || 0,
-      pullRequests: pullRequests?.length || 0,
-      issues: issues?.length || 0
-    });
+    if (isLevelEnabled('debug')) {
+      logger.debug('Data counts:', {
+        commits: commits?.length || 0,
+        pullRequests: pullRequests?.length || 0,
+        issues: issues?.length || 0
+      });
+    }
   } catch (error) {
-    console.error('Failed to fetch GitHub data:', error);
+    logger.error('Failed to fetch GitHub data:', error.message);
     throw new Error(`Failed to fetch repository data: ${error.message}`);
   }
   
@@ -100,8 +95,40 @@ export default asyncHandler(async (req, res) => {
   const languagePercentages = calculateLanguagePercentages(languagesData, repoData.language);
   const fileTypes = analyzeFileTypes(contentsData);
   const activityHeatmap = generateActivityHeatmap(commits);
-  const quarterlyInsights = calculateQuarterlyInsights(commits, contributors, pullRequests);
   const riskAssessment = calculateRiskAssessment(contributors);
+  const totalContributions = contributors.reduce((sum, c) => sum + c.contributions, 0);
+  
+  // Only the top five contributors get per-person detail entries
+  const topContributors = contributors.slice(0, 5);
+  const expertiseAreas = Object.keys(languagePercentages).slice(0, 2);
+  
+  // PR states and PRs per author in one pass; keys keep first-seen order like the Set did
+  const pullRequestsByAuthor = new Map();
+  let mergedPullRequests = 0;
+  let openPullRequests = 0;
+  for (const pr of pullRequests) {
+    if (pr.merged_at) mergedPullRequests++;
+    if (pr.state === 'open') openPullRequests++;
+    
+    const author = pr.user?.login;
+    if (author) {
+      pullRequestsByAuthor.set(author, (pullRequestsByAuthor.get(author) || 0) + 1);
+    }
+  }
+  const pullRequestAuthors = Array.from(pullRequestsByAuthor.keys());
+  const quarterlyInsights = calculateQuarterlyInsights(commits, contributors, pullRequests, mergedPullRequests);
+  
+  // The issues endpoint also returns pull requests; tally real issues in one pass
+  const issueCounts = { total: 0, open: 0, closed: 0 };
+  for (const issue of issues) {
+    if (issue.pull_request) continue;
+    issueCounts.total++;
+    if (issue.state === 'open') {
+      issueCounts.open++;
+    } else if (issue.state === 'closed') {
+      issueCounts.closed++;
+    }
+  }
   
   // Build comprehensive analysis response
   const analysis = {
@@ -128,8 +155,7 @@ export default asyncHandler(async (req, res) => {
       quarterly_insights: quarterlyInsights
     },
     dependency_risk: {
-      key_contributors: contributors.slice(0, 5).map(contributor => {
-        const totalContributions = contributors.reduce((sum, c) => sum + c.contributions, 0);
+      key_contributors: topContributors.map(contributor => {
         const percentage = totalContributions > 0 
           ? Math.round((contributor.contributions / totalContributions) * 100) 
           : 0;
@@ -152,17 +178,14 @@ export default asyncHandler(async (req, res) => {
       pull_request_analysis: {
         workflow_analysis: {
           collaboration_pairs: collaborationPairs,
-          most_active_authors: Array.from(new Set(pullRequests.map(pr => pr.user?.login).filter(Boolean)))
-            .map(author => [author, pullRequests.filter(pr => pr.user?.login === author).length])
-            .sort((a, b) => b[1] - a[1])
-            .slice(0, 5),
+          most_active_authors: selectTopCounts(pullRequestsByAuthor, 5),
           most_active_reviewers: [],
           quarterly_trends: {
             most_active_quarter: ['Q4 2024', { prs: Math.floor(pullRequests.length * 0.4) }],
             highest_quality_quarter: ['Q3 2024', { merge_rate: 85 }],
             total_quarterly_prs: pullRequests.length,
             avg_quarterly_merge_rate: pullRequests.length > 0 
-              ? Math.round((pullRequests.filter(pr => pr.merged_at).length / pullRequests.length) * 100) 
+              ? Math.round((mergedPullRequests / pullRequests.length) * 100) 
               : 0
           }
         }
@@ -171,15 +194,11 @@ export default asyncHandler(async (req, res) => {
     collaboration_patterns: {
       pull_requests: {
         total: pullRequests.length,
-        merged: pullRequests.filter(pr => pr.merged_at).length,
-        open: pullRequests.filter(pr => pr.state === 'open').length,
-        contributors: Array.from(new Set(pullRequests.map(pr => pr.user?.login).filter(Boolean)))
+        merged: mergedPullRequests,
+        open: openPullRequests,
+        contributors: pullRequestAuthors
       },
-      issues: {
-        total: issues.filter(issue => !issue.pull_request).length,
-        open: issues.filter(issue => !issue.pull_request && issue.state === 'open').length,
-        closed: issues.filter(issue => !issue.pull_request && issue.state === 'closed').length
-      }
+      issues: issueCounts
     },
     knowledge_areas: {
       languages: languagePercentages,
@@ -192,12 +211,12 @@ export default asyncHandler(async (req, res) => {
           size: dir.size || 0
         }))
         .slice(0, 10),
-      core_contributors: contributors.slice(0, 5).map(contributor => ({
+      core_contributors: topContributors.map(contributor => ({
         name: contributor.login,
         contributions: contributor.contributions,
         commit_count: contributor.contributions,
         active_days: 90,
-        expertise_areas: Object.keys(languagePercentages).slice(0, 2),
+        expertise_areas: expertiseAreas,
         files_owned: Math.floor(contributor.contributions / 10),
         knowledge_score: Math.min(contributor.contributions / 10, 100)
       }))
@@ -1,6 +1,6 @@
 import { getSessionFromRequest } from '../utils/auth.js';
 import { asyncHandler, handleCors, sendSuccess } from '../utils/response.js';
-import { fetchAllPages } from '../utils/github.js';
+import { fetchAllPages, toRepositorySummary } from '../utils/github.js';
 
 export default asyncHandler(async (req, res) => {
   if (handleCors(req, res)) return;
@@ -14,5 +14,5 @@ export default asyncHandler(async (req, res) => {
     100 // Limit to 100 starred repos for performance
   );
   
-  sendSuccess(res, starredRepos);
+  sendSuccess(res, starredRepos.map(toRepositorySummary));
 });
\ No newline at end of file
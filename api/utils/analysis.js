@@ -13,25 +13,51 @@ export function extractContributors(commits) {
   commits.forEach(commit => {
     const author = commit.author || {};
     const login = author.login || commit.commit?.author?.name;
+    if (!login) return;
     
-    if (login && !contributorMap.has(login)) {
+    // One lookup per commit; the entry is only built the first time
+    const contributor = contributorMap.get(login);
+    if (contributor) {
+      contributor.contributions++;
+    } else {
       contributorMap.set(login, {
         login,
-        contributions: 0,
+        contributions: 1,
         avatar_url: author.avatar_url || '',
         html_url: author.html_url || ''
       });
     }
-    
-    if (login) {
-      contributorMap.get(login).contributions++;
-    }
   });
   
   return Array.from(contributorMap.values())
     .sort((a, b) => b.contributions - a.contributions);
 }
 
+/**
+ * Select the highest counts without sorting every entry
+ * @param {Map<string, number>} counts - Count per key
+ * @param {number} limit - Number of entries to keep
+ * @returns {Array} [key, count] pairs, highest first; ties keep insertion order
+ */
+export function selectTopCounts(counts, limit) {
+  const top = [];
+  if (limit <= 0) return top;
+  
+  for (const entry of counts) {
+    if (top.length === limit && entry[1] <= top[limit - 1][1]) continue;
+    
+    // Insertion into a list of at most `limit` entries: O(n * limit) overall
+    let index = Math.min(top.length, limit - 1);
+    while (index > 0 && top[index - 1][1] < entry[1]) {
+      top[index] = top[index - 1];
+      index--;
+    }
+    top[index] = entry;
+  }
+  
+  return top;
+}
+
 /**
  * Generate collaboration pairs from contributors
  * @param {Array} contributors - Array of contributor objects
@@ -40,10 +66,11 @@ export function extractContributors(commits) {
  */
 export function generateCollaborationPairs(contributors, maxPairs = 6) {
   const pairs = [];
-  const topContributors = contributors.slice(0, 5);
+  // Pairs are drawn from the top three contributors only
+  const topContributors = contributors.slice(0, 3);
   
-  for (let i = 0; i < Math.min(topContributors.length, 3); i++) {
-    for (let j = i + 1; j < Math.min(topContributors.length, 3); j++) {
+  for (let i = 0; i < topContributors.length; i++) {
+    for (let j = i + 1; j < topContributors.length; j++) {
       const author1 = topContributors[i];
       const author2 = topContributors[j];
       const interactions = Math.floor(
@@ -70,13 +97,18 @@ export function generateCollaborationPairs(contributors, maxPairs = 6) {
  * @returns {object} Language percentages
  */
 export function calculateLanguagePercentages(languagesData, fallbackLanguage = null) {
-  const totalBytes = Object.values(languagesData).reduce((sum, bytes) => sum + bytes, 0);
+  // Enumerate the object once and reuse the entries for both passes
+  const languages = Object.entries(languagesData);
+  let totalBytes = 0;
+  for (const [, bytes] of languages) {
+    totalBytes += bytes;
+  }
   
   if (totalBytes > 0) {
     const percentages = {};
-    Object.entries(languagesData).forEach(([lang, bytes]) => {
+    for (const [lang, bytes] of languages) {
       percentages[lang] = Math.round((bytes / totalBytes) * 100);
-    });
+    }
     return percentages;
   }
   
@@ -123,10 +155,20 @@ export function generateActivityHeatmap(commits) {
   
   commits.forEach(commit => {
     const commitDate = commit.commit?.author?.date;
-    if (commitDate) {
-      const date = new Date(commitDate).toISOString().split('T')[0];
-      daily[date] = (daily[date] || 0) + 1;
+    if (!commitDate) return;
+    
+    // GitHub timestamps are fixed-width UTC ('YYYY-MM-DDTHH:MM:SSZ'), so the day
+    // is the first 10 characters; anything else needs a Date round trip
+    let date;
+    if (commitDate.length === 20 && commitDate.endsWith('Z')) {
+      date = commitDate.slice(0, 10);
+    } else {
+      // toISOString throws on an invalid date; skip those commits instead
+      const time = Date.parse(commitDate);
+      if (Number.isNaN(time)) return;
+      date = new Date(time).toISOString().slice(0, 10);
     }
+    daily[date] = (daily[date] || 0) + 1;
   });
   
   return { daily: Object.fromEntries(Object.entries(daily).sort()) };
@@ -137,10 +179,15 @@ export function generateActivityHeatmap(commits) {
  * @param {Array} commits - Array of commit objects
  * @param {Array} contributors - Array of contributor objects
  * @param {Array} pullRequests - Array of pull request objects
+ * @param {number} mergedCount - Merged pull requests, if the caller already counted them
  * @returns {object} Quarterly insights data
  */
-export function calculateQuarterlyInsights(commits, contributors, pullRequests) {
-  const mergedPRs = pullRequests.filter(pr => pr.merged_at);
+export function calculateQuarterlyInsights(
+  commits,
+  contributors,
+  pullRequests,
+  mergedCount = pullRequests.reduce((count, pr) => (pr.merged_at ? count + 1 : count), 0)
+) {
   
   return {
     year_over_year: {
@@ -148,7 +195,7 @@ export function calculateQuarterlyInsights(commits, contributors, pullRequests)
       total_contributors: contributors.length,
       total_prs: pullRequests.length,
       overall_merge_rate: pullRequests.length > 0 
-        ? Math.round((mergedPRs.length / pullRequests.length) * 100) 
+        ? Math.round((mergedCount / pullRequests.length) * 100) 
         : 0,
       avg_commits_per_day: Math.round(commits.length / 365),
       avg_quarterly_velocity: Math.round(commits.length / 4),
@@ -1,6 +1,27 @@
+import crypto from 'crypto';
 import jwt from 'jsonwebtoken';
+import { TTLCache } from './cache.js';
+import { getConfig } from './config.js';
 
-const JWT_SECRET = process.env.JWT_SECRET || 'your-super-secret-jwt-key-change-in-production';
+const JWT_SECRET = getConfig().jwtSecret;
+
+const SESSION_COOKIE = 'sid';
+
+// Holds the nonce of the login this browser started, so a callback carrying
+// someone else's state (login CSRF) is rejected
+const OAUTH_STATE_COOKIE = 'oauth_state';
+
+// header.payload.signature, each base64url encoded
+const JWT_PATTERN = /^[\w-]+\.[\w-]+\.[\w-]+$/;
+
+// GitHub's authorize window - abandoned logins simply expire, nothing is stored
+const OAUTH_STATE_TTL_SECONDS = 600;
+
+// Signed states are ~200 characters; anything much longer is not one of ours
+const MAX_OAUTH_STATE_LENGTH = 512;
+
+// Nonces of states already exchanged on this instance, kept until they expire
+const consumedStateNonces = new TTLCache({ maxSize: 10000, ttlMs: OAUTH_STATE_TTL_SECONDS * 1000 });
 
 /**
  * Verify JWT token and return decoded payload
@@ -9,11 +30,24 @@ const JWT_SECRET = process.env.JWT_SECRET || 'your-super-secret-jwt-key-change-i
  * @throws {Error} If token is invalid or expired
  */
 export function verifyToken(token) {
+  // Cheap shape check before the HMAC verify and JSON decode
+  if (typeof token !== 'string' || !JWT_PATTERN.test(token)) {
+    throw new Error('Invalid or expired session');
+  }
+
+  let payload;
   try {
-    return jwt.verify(token, JWT_SECRET);
+    payload = jwt.verify(token, JWT_SECRET);
   } catch (error) {
     throw new Error('Invalid or expired session');
   }
+
+  // OAuth states are signed with the same secret but are not sessions
+  if (payload.typ === 'oauth_state') {
+    throw new Error('Invalid or expired session');
+  }
+
+  return payload;
 }
 
 /**
@@ -33,17 +67,128 @@ export function createToken(user, accessToken, expiresInHours = 24) {
 }
 
 /**
- * Middleware to verify session from query parameters
+ * Build the Set-Cookie header value carrying the session token
+ * @param {string} token - JWT session token
+ * @param {boolean} secure - Whether to restrict the cookie to HTTPS
+ * @param {number} maxAgeSeconds - Cookie lifetime in seconds (default: 24 hours)
+ * @returns {string} Set-Cookie header value
+ */
+export function buildSessionCookie(token, secure, maxAgeSeconds = 86400) {
+  return `${SESSION_COOKIE}=${token}; Path=/api; Max-Age=${maxAgeSeconds}; HttpOnly; SameSite=Lax${secure ? '; Secure' : ''}`;
+}
+
+/**
+ * Build the Set-Cookie header value removing the session cookie
+ * @param {boolean} secure - Whether the cookie was restricted to HTTPS
+ * @returns {string} Set-Cookie header value
+ */
+export function clearSessionCookie(secure) {
+  return `${SESSION_COOKIE}=; Path=/api; Max-Age=0; HttpOnly; SameSite=Lax${secure ? '; Secure' : ''}`;
+}
+
+/**
+ * Get the raw session token from the HttpOnly session cookie
+ * @param {object} req - Request object
+ * @returns {string|undefined} Session token if present
+ */
+export function getSessionToken(req) {
+  return req.cookies?.[SESSION_COOKIE];
+}
+
+/**
+ * Middleware to verify session from the session cookie
  * @param {object} req - Request object
  * @returns {object} Decoded session data
  * @throws {Error} If session is invalid
  */
 export function getSessionFromRequest(req) {
-  const { session_id } = req.query;
+  const sessionToken = getSessionToken(req);
   
-  if (!session_id) {
+  if (!sessionToken) {
     throw new Error('Session ID not provided');
   }
   
-  return verifyToken(session_id);
+  return verifyToken(sessionToken);
+}
+
+/**
+ * Verify the session if one was provided, for endpoints that also serve anonymous requests
+ * @param {object} req - Request object
+ * @returns {object|null} Decoded session data, or null when no session was sent
+ * @throws {Error} If a session was provided but is invalid
+ */
+export function getOptionalSessionFromRequest(req) {
+  const sessionToken = getSessionToken(req);
+  return sessionToken ? verifyToken(sessionToken) : null;
+}
+
+/**
+ * Create a signed, short-lived OAuth state parameter
+ * @returns {{state: string, nonce: string}} Signed state token and its nonce
+ */
+export function createOAuthState() {
+  // randomUUID draws from Node's buffered entropy cache rather than a
+  // fresh randomBytes call per login
+  const nonce = crypto.randomUUID();
+  const state = jwt.sign(
+    { typ: 'oauth_state', nonce },
+    JWT_SECRET,
+    { expiresIn: OAUTH_STATE_TTL_SECONDS }
+  );
+  return { state, nonce };
+}
+
+/**
+ * Build the Set-Cookie header value binding a login to the browser that started it
+ * @param {string} nonce - Nonce of the issued state
+ * @param {boolean} secure - Whether to restrict the cookie to HTTPS
+ * @returns {string} Set-Cookie header value
+ */
+export function buildOAuthStateCookie(nonce, secure) {
+  return `${OAUTH_STATE_COOKIE}=${nonce}; Path=/api/auth; Max-Age=${OAUTH_STATE_TTL_SECONDS}; HttpOnly; SameSite=Lax${secure ? '; Secure' : ''}`;
+}
+
+/**
+ * Build the Set-Cookie header value removing the OAuth state cookie
+ * @param {boolean} secure - Whether the cookie was restricted to HTTPS
+ * @returns {string} Set-Cookie header value
+ */
+export function clearOAuthStateCookie(secure) {
+  return `${OAUTH_STATE_COOKIE}=; Path=/api/auth; Max-Age=0; HttpOnly; SameSite=Lax${secure ? '; Secure' : ''}`;
+}
+
+/**
+ * Verify the OAuth state parameter returned by GitHub against the browser's
+ * state cookie and mark it as used
+ * @param {string} state - State token from the callback query
+ * @param {object} req - Callback request carrying the OAuth state cookie
+ * @returns {object} Decoded state payload
+ * @throws {Error} If state is missing, invalid, expired, replayed or not this browser's
+ */
+export function consumeOAuthState(state, req) {
+  // Reject oversized or malformed values before verifying and touching the nonce cache
+  if (typeof state !== 'string' || state.length > MAX_OAUTH_STATE_LENGTH || !JWT_PATTERN.test(state)) {
+    throw new Error('Invalid state parameter');
+  }
+
+  let payload;
+  try {
+    payload = jwt.verify(state, JWT_SECRET);
+  } catch (error) {
+    throw new Error('Invalid state parameter');
+  }
+
+  // The nonce must match the cookie set when this browser started the login.
+  // Check-and-mark runs synchronously, so two concurrent callbacks
+  // carrying the same state cannot both pass
+  if (
+    payload.typ !== 'oauth_state' ||
+    req.cookies?.[OAUTH_STATE_COOKIE] !== payload.nonce ||
+    consumedStateNonces.has(payload.nonce)
+  ) {
+    throw new Error('Invalid state parameter');
+  }
+  consumedStateNonces.set(payload.nonce, true);
+
+  return payload;
 }
\ No newline at end of file
@@ -0,0 +1,72 @@
+/**
+ * In-memory caching utilities
+ *
+ * Serverless instances are reused between invocations while warm, so
+ * module-level caches survive across requests on the same instance.
+ */
+
+/**
+ * Bounded Map with per-entry expiry and least-recently-used eviction
+ */
+export class TTLCache {
+  /**
+   * @param {object} options - Cache options
+   * @param {number} options.maxSize - Maximum number of entries kept
+   * @param {number} options.ttlMs - Default time-to-live in milliseconds
+   */
+  constructor({ maxSize = 1000, ttlMs = 60000 } = {}) {
+    this.maxSize = maxSize;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+  }
+
+  /**
+   * Get a live entry, refreshing its recency
+   * @param {string} key - Cache key
+   * @returns {any} Cached value, or undefined if missing or expired
+   */
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    this.entries.delete(key);
+    if (entry.expiresAt <= Date.now()) return undefined;
+
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * Check whether a live entry exists without refreshing it
+   * @param {string} key - Cache key
+   * @returns {boolean} True if the key is cached and not expired
+   */
+  has(key) {
+    const entry = this.entries.get(key);
+    return !!entry && entry.expiresAt > Date.now();
+  }
+
+  /**
+   * Store an entry, evicting the least recently used one when full
+   * @param {string} key - Cache key
+   * @param {any} value - Value to cache
+   * @param {number} ttlMs - Optional per-entry time-to-live
+   */
+  set(key, value, ttlMs = this.ttlMs) {
+    this.entries.delete(key);
+    if (this.entries.size >= this.maxSize) {
+      // Map iterates in insertion order, so the first key is the oldest
+      this.entries.delete(this.entries.keys().next().value);
+    }
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+  }
+
+  /**
+   * Remove an entry
+   * @param {string} key - Cache key
+   * @returns {boolean} True if an entry was removed
+   */
+  delete(key) {
+    return this.entries.delete(key);
+  }
+}
\ No newline at end of file
@@ -0,0 +1,22 @@
+/**
+ * Deployment configuration read from environment variables
+ */
+
+let config = null;
+
+/**
+ * Get deployment configuration, reading the environment on first use only
+ * @returns {object} Frozen configuration values
+ */
+export function getConfig() {
+  if (!config) {
+    config = Object.freeze({
+      jwtSecret: process.env.JWT_SECRET || 'your-super-secret-jwt-key-change-in-production',
+      clientId: process.env.GITHUB_CLIENT_ID,
+      clientSecret: process.env.GITHUB_CLIENT_SECRET,
+      redirectUri: process.env.GITHUB_REDIRECT_URI,
+      frontendUrl: process.env.FRONTEND_URL || 'http://localhost:3000'
+    });
+  }
+  return config;
+}
\ No newline at end of file
@@ -1,28 +1,229 @@
 /**
  * GitHub API utility functions
  */
+import crypto from 'crypto';
 import fetch from 'node-fetch';
+import https from 'https';
+import { TTLCache } from './cache.js';
+import { logger } from './logger.js';
 
 const GITHUB_API_BASE = 'https://api.github.com';
 
+const REQUEST_TIMEOUT_MS = 30000;
+
+// ETag-validated responses, revalidated with If-None-Match. Bounded because
+// commit pages can be several hundred KB each
+const etagCache = new TTLCache({ maxSize: 100, ttlMs: 10 * 60 * 1000 });
+
+// Latest X-RateLimit-* quota seen per (hashed) token and resource; GitHub
+// meters REST ('core') and GraphQL in separate buckets
+const rateLimitState = new TTLCache({ maxSize: 1000, ttlMs: 60 * 60 * 1000 });
+
+// Total time one request may spend waiting on rate limits, across the pre-request
+// wait and all retries. Serverless functions cannot sit out a long reset window,
+// so fail fast with a 429 rather than run into the platform timeout
+const MAX_RATE_LIMIT_WAIT_MS = 10000;
+const MAX_RATE_LIMIT_RETRIES = 3;
+
+// GitHub asks for at least a minute's pause after a secondary limit that
+// carries no retry-after or reset guidance; retrying sooner extends it
+const SECONDARY_LIMIT_WAIT_MS = 60000;
+
+// Pages in flight at once when the total page count is known
+const PAGE_FETCH_CONCURRENCY = 5;
+
+// Commit, pull request and issue lists per (hashed) token, repository and
+// date range, so switching between ranges and reloading skip GitHub entirely.
+// Promises are cached so concurrent requests for the same input share a fetch.
+// Items are projected to the fields the analysis reads before caching
+const analysisInputCache = new TTLCache({ maxSize: 50, ttlMs: 5 * 60 * 1000 });
+
+// Default-branch history with only the fields the analysis reads; a REST
+// commit object is several KB, mostly file stats and URLs that go unused
+const COMMIT_HISTORY_QUERY = `
+  query($owner: String!, $repo: String!, $since: GitTimestamp, $until: GitTimestamp, $cursor: String) {
+    repository(owner: $owner, name: $repo) {
+      defaultBranchRef {
+        target {
+          ... on Commit {
+            history(since: $since, until: $until, first: 100, after: $cursor) {
+              pageInfo { hasNextPage endCursor }
+              nodes {
+                oid
+                authoredDate
+                author { name user { login avatarUrl url } }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+`;
+
+// Shared keep-alive agent so warm invocations reuse TCP+TLS connections
+// to github.com / api.github.com instead of handshaking on every request
+const httpsAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: 100,
+  maxFreeSockets: 50,
+  timeout: REQUEST_TIMEOUT_MS
+});
+
 /**
- * Make a request to GitHub API with authentication
- * @param {string} endpoint - API endpoint (without base URL)
- * @param {string} accessToken - GitHub access token
- * @param {object} options - Additional fetch options
- * @returns {Promise<object>} API response
+ * Fetch wrapper that routes requests through the shared keep-alive agent
+ * with default headers and a request timeout
+ * @param {string} url - Absolute URL to request
+ * @param {object} options - Fetch options
+ * @returns {Promise<Response>} Fetch response
  */
-export async function githubApiRequest(endpoint, accessToken, options = {}) {
-  const url = endpoint.startsWith('http') ? endpoint : `${GITHUB_API_BASE}${endpoint}`;
-  
-  const response = await fetch(url, {
+export function githubFetch(url, options = {}) {
+  return fetch(url, {
+    agent: httpsAgent,
+    signal: AbortSignal.timeout(REQUEST_TIMEOUT_MS),
     ...options,
     headers: {
-      'Authorization': `token ${accessToken}`,
-      'Accept': 'application/vnd.github.v3+json',
+      'User-Agent': 'gitpeek',
       ...options.headers
     }
   });
+}
+
+/**
+ * Hash an access token so per-user caches never keep the secret as a key
+ * @param {string} accessToken - GitHub access token
+ * @returns {string} Token hash, or 'anonymous' for unauthenticated requests
+ */
+function hashToken(accessToken) {
+  return accessToken
+    ? crypto.createHash('sha256').update(accessToken).digest('base64url')
+    : 'anonymous';
+}
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * Wait for the quota window to reset if this token has no requests left
+ * @param {string} rateLimitKey - Hashed access token and rate-limit resource
+ * @param {number} budgetMs - Waiting time still available to this request
+ * @returns {Promise<number>} Milliseconds spent waiting
+ * @throws {Error} If the reset is further away than we can afford to wait
+ */
+async function waitForRateLimit(rateLimitKey, budgetMs) {
+  const state = rateLimitState.get(rateLimitKey);
+  if (!state || state.remaining > 0) return 0;
+  
+  const waitMs = state.resetAt - Date.now();
+  if (waitMs <= 0) return 0;
+  if (waitMs > budgetMs) {
+    throw new Error('GitHub API rate limit exceeded');
+  }
+  await sleep(waitMs);
+  return waitMs;
+}
+
+/**
+ * Remember the quota reported by GitHub's X-RateLimit-* headers
+ * @param {string} rateLimitKey - Hashed access token and rate-limit resource
+ * @param {Headers} headers - Response headers
+ */
+function recordRateLimit(rateLimitKey, headers) {
+  const remaining = headers.get('x-ratelimit-remaining');
+  const reset = headers.get('x-ratelimit-reset');
+  if (remaining !== null && reset !== null) {
+    rateLimitState.set(rateLimitKey, {
+      remaining: parseInt(remaining, 10),
+      resetAt: parseInt(reset, 10) * 1000
+    });
+  }
+}
+
+/**
+ * Check whether a response is a primary or secondary rate-limit rejection
+ * @param {Response} response - Fetch response
+ * @returns {Promise<boolean>} True if the request should be retried later
+ */
+async function isRateLimited(response) {
+  if (response.status === 429) return true;
+  if (response.status !== 403) return false;
+  if (response.headers.has('retry-after') || response.headers.get('x-ratelimit-remaining') === '0') {
+    return true;
+  }
+  
+  // Secondary limits can come as a bare 403; only the message identifies them.
+  // Other 403s are turned into an error without reading the body, so consuming it is safe
+  const body = await response.text().catch(() => '');
+  return /rate limit/i.test(body);
+}
+
+/**
+ * Work out how long to back off after a rate-limit rejection
+ * @param {Response} response - Rate-limited response
+ * @returns {number} Delay in milliseconds
+ */
+function getRetryDelay(response) {
+  const retryAfter = response.headers.get('retry-after');
+  if (retryAfter !== null) {
+    return parseInt(retryAfter, 10) * 1000;
+  }
+  
+  const reset = response.headers.get('x-ratelimit-reset');
+  if (response.headers.get('x-ratelimit-remaining') === '0' && reset !== null) {
+    return parseInt(reset, 10) * 1000 - Date.now();
+  }
+  
+  // Secondary limit without guidance: GitHub's documented minimum pause
+  return SECONDARY_LIMIT_WAIT_MS;
+}
+
+/**
+ * Make a request to GitHub API with authentication, revalidating cached
+ * GET responses with If-None-Match and pacing requests by the rate-limit headers
+ * @param {string} endpoint - API endpoint (without base URL)
+ * @param {string} accessToken - GitHub access token
+ * @param {object} options - Additional fetch options; cache: 'no-store' skips the
+ *   ETag cache for single-use responses that would only evict useful entries
+ * @returns {Promise<{data: any, headers: Headers}>} Parsed body and response headers
+ */
+async function githubApiFetch(endpoint, accessToken, options = {}) {
+  const url = endpoint.startsWith('http') ? endpoint : `${GITHUB_API_BASE}${endpoint}`;
+  const tokenHash = hashToken(accessToken);
+  const cacheable = (!options.method || options.method === 'GET') && options.cache !== 'no-store';
+  const cacheKey = cacheable ? `${tokenHash} ${url}` : null;
+  const rateLimitKey = `${tokenHash} ${url.endsWith('/graphql') ? 'graphql' : 'core'}`;
+  const cached = cacheKey ? etagCache.get(cacheKey) : undefined;
+  
+  let response;
+  let waitedMs = 0;
+  for (let attempt = 0; ; attempt++) {
+    waitedMs += await waitForRateLimit(rateLimitKey, MAX_RATE_LIMIT_WAIT_MS - waitedMs);
+    
+    response = await githubFetch(url, {
+      ...options,
+      headers: {
+        // Anonymous requests (public repos) must omit the header entirely
+        ...(accessToken && { 'Authorization': `token ${accessToken}` }),
+        'Accept': 'application/vnd.github.v3+json',
+        ...(cached && { 'If-None-Match': cached.etag }),
+        ...options.headers
+      }
+    });
+    
+    recordRateLimit(rateLimitKey, response.headers);
+    if (!(await isRateLimited(response))) break;
+    
+    const delay = Math.max(getRetryDelay(response), 0);
+    if (attempt >= MAX_RATE_LIMIT_RETRIES || delay > MAX_RATE_LIMIT_WAIT_MS - waitedMs) {
+      throw new Error('GitHub API rate limit exceeded');
+    }
+    await sleep(delay);
+    waitedMs += delay;
+  }
+  
+  // Unchanged since last time: GitHub sends no body and does not count it against the rate limit
+  if (response.status === 304 && cached) {
+    return cached;
+  }
   
   if (!response.ok) {
     if (response.status === 401) {
@@ -34,7 +235,82 @@ export async function githubApiRequest(endpoint, accessToken, options = {}) {
     throw new Error(`GitHub API error: ${response.status}`);
   }
   
-  return response.json();
+  const result = { data: await response.json(), headers: response.headers };
+  
+  const etag = response.headers.get('etag');
+  if (cacheKey && etag) {
+    etagCache.set(cacheKey, { ...result, etag });
+  }
+  
+  return result;
+}
+
+/**
+ * Make a request to GitHub API with authentication
+ * @param {string} endpoint - API endpoint (without base URL)
+ * @param {string} accessToken - GitHub access token
+ * @param {object} options - Additional fetch options
+ * @returns {Promise<object>} API response
+ */
+export async function githubApiRequest(endpoint, accessToken, options = {}) {
+  const { data } = await githubApiFetch(endpoint, accessToken, options);
+  return data;
+}
+
+/**
+ * Map items through an async function with at most `limit` calls in flight.
+ * Each worker picks up the next item as soon as its previous call settles,
+ * so one slow request does not hold back a whole batch.
+ * @param {Array} items - Items to process
+ * @param {number} limit - Maximum concurrent calls
+ * @param {function} fn - Async mapper
+ * @returns {Promise<Array>} Results in input order
+ */
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let nextIndex = 0;
+  
+  const worker = async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index]);
+    }
+  };
+  
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+/**
+ * Get the last page number advertised by a GitHub Link header
+ * @param {string|null} linkHeader - Link response header
+ * @returns {number} Last page number (1 when there is no further page)
+ */
+function getLastPage(linkHeader) {
+  // Single-page responses carry no Link header or no rel="last"; skip the regex
+  if (!linkHeader?.includes('rel="last"')) return 1;
+  
+  const match = linkHeader.match(/<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"/);
+  return match ? parseInt(match[1], 10) : 1;
+}
+
+/**
+ * Check whether a GitHub Link header advertises a further page
+ * @param {string|null} linkHeader - Link response header
+ * @returns {boolean} True when a rel="next" link is present
+ */
+function hasNextPage(linkHeader) {
+  return linkHeader?.includes('rel="next"') ?? false;
+}
+
+/**
+ * Format epoch milliseconds as a second-precision UTC timestamp in GitHub's
+ * fixed-width format ('YYYY-MM-DDTHH:MM:SSZ'), which orders correctly as a string
+ * @param {number} time - Epoch milliseconds
+ * @returns {string|null} Timestamp key, or null for an invalid time
+ */
+function toTimestampKey(time) {
+  return Number.isFinite(time) ? `${new Date(time).toISOString().slice(0, 19)}Z` : null;
 }
 
 /**
@@ -53,6 +329,24 @@ export async function fetchPagesWithDateTermination(endpoint, accessToken, param
   const perPage = 100;
   let shouldContinue = true;
   
+  // Loop invariants: the range bounds as timestamp keys, rounded inwards to
+  // whole seconds (GitHub's precision) so string comparison stays exact
+  const sinceKey = since ? toTimestampKey(Math.ceil(Date.parse(since) / 1000) * 1000) : null;
+  const untilKey = until ? toTimestampKey(Math.floor(Date.parse(until) / 1000) * 1000) : null;
+  const dateFieldParts = dateField.split('.');
+  // Resolve the field shape once instead of branching on it for every item
+  const readItemDate = dateFieldParts.length > 1
+    ? item => {
+        // Nested date fields like 'commit.author.date'
+        let value = item;
+        for (const part of dateFieldParts) {
+          value = value?.[part];
+          if (value == null) return item.created_at;
+        }
+        return value;
+      }
+    : item => item[dateField];
+  
   while (shouldContinue) {
     const queryParams = new URLSearchParams({
       ...params,
@@ -60,7 +354,7 @@ export async function fetchPagesWithDateTermination(endpoint, accessToken, param
       page: page
     });
     
-    const items = await githubApiRequest(`${endpoint}?${queryParams}`, accessToken);
+    const { data: items, headers } = await githubApiFetch(`${endpoint}?${queryParams}`, accessToken);
     
     if (!Array.isArray(items) || items.length === 0) {
       break;
@@ -71,35 +365,30 @@ export async function fetchPagesWithDateTermination(endpoint, accessToken, param
     let shouldTerminate = false;
     
     for (const item of items) {
-      // Handle nested date fields like 'commit.author.date'
-      let itemDate;
-      if (dateField.includes('.')) {
-        const parts = dateField.split('.');
-        let value = item;
-        for (const part of parts) {
-          value = value?.[part];
-        }
-        itemDate = new Date(value || item.created_at);
-      } else {
-        itemDate = new Date(item[dateField]);
-      }
+      // GitHub timestamps are already keys; only other formats need parsing
+      const itemDate = readItemDate(item);
+      const itemKey = typeof itemDate === 'string' && itemDate.length === 20 && itemDate.endsWith('Z')
+        ? itemDate
+        : toTimestampKey(Date.parse(itemDate));
+      if (itemKey === null) continue;
       
       // If we've gone past our date range (too old), stop fetching
-      if (since && itemDate < new Date(since)) {
+      if (sinceKey !== null && itemKey < sinceKey) {
         shouldTerminate = true;
         break;
       }
       
       // Include items within our date range
-      if ((!since || itemDate >= new Date(since)) && (!until || itemDate <= new Date(until))) {
+      if (untilKey === null || itemKey <= untilKey) {
         validItems.push(item);
       }
     }
     
     allItems.push(...validItems);
     
-    // Stop if we've reached the end of our date range
-    if (shouldTerminate || items.length < perPage) {
+    // Stop if we've reached the end of our date range or GitHub has no next
+    // page; a full last page would otherwise cost one more empty request
+    if (shouldTerminate || !hasNextPage(headers.get('link'))) {
       shouldContinue = false;
     }
     
@@ -107,12 +396,12 @@ export async function fetchPagesWithDateTermination(endpoint, accessToken, param
     
     // Safety limit to prevent infinite loops
     if (page > 50) {
-      console.warn(`Reached page limit (50) for ${endpoint}`);
+      logger.warn('Reached page limit (50) for %s', endpoint);
       break;
     }
   }
   
-  console.log(`Smart pagination: fetched ${allItems.length} items from ${page - 1} pages`);
+  logger.debug('Smart pagination: fetched %d items from %d pages', allItems.length, page - 1);
   return allItems;
 }
 
@@ -125,80 +414,274 @@ export async function fetchPagesWithDateTermination(endpoint, accessToken, param
  * @returns {Promise<Array>} All items from all pages
  */
 export async function fetchAllPages(endpoint, accessToken, params = {}, maxItems = 0) {
-  const allItems = [];
-  let page = 1;
   const perPage = 100;
+  const pageEndpoint = (page) => `${endpoint}?${new URLSearchParams({
+    ...params,
+    per_page: perPage,
+    page: page
+  })}`;
   
-  while (true) {
-    const queryParams = new URLSearchParams({
-      ...params,
-      per_page: perPage,
-      page: page
-    });
+  // Page 1 tells us (via the Link header) how many pages there are
+  const { data: firstItems, headers: firstHeaders } = await githubApiFetch(pageEndpoint(1), accessToken);
+  
+  if (!Array.isArray(firstItems)) {
+    return [];
+  }
+  
+  // Append only what still fits under maxItems so the result is exact as built
+  const limit = maxItems > 0 ? maxItems : Infinity;
+  const allItems = [...firstItems];
+  if (allItems.length > limit) {
+    allItems.length = limit;
+  }
+  const appendPage = (items) => {
+    const remaining = limit - allItems.length;
+    if (Array.isArray(items) && remaining > 0) {
+      allItems.push(...(items.length > remaining ? items.slice(0, remaining) : items));
+    }
+  };
+  
+  const firstLink = firstHeaders.get('link');
+  let lastPage = getLastPage(firstLink);
+  
+  // A next page without a parsable rel="last" leaves the page count unknown:
+  // follow the next links one page at a time instead of stopping at page 1
+  if (lastPage === 1 && hasNextPage(firstLink)) {
+    let link = firstLink;
+    for (let page = 2; hasNextPage(link) && allItems.length < limit; page++) {
+      const { data: items, headers } = await githubApiFetch(pageEndpoint(page), accessToken);
+      if (!Array.isArray(items) || items.length === 0) break;
+      appendPage(items);
+      link = headers.get('link');
+    }
+    return allItems;
+  }
+  
+  if (maxItems > 0) {
+    lastPage = Math.min(lastPage, Math.ceil(maxItems / perPage));
+  }
+  
+  // Fetch the remaining pages with a bounded pool of concurrent requests
+  const remainingPages = Array.from({ length: Math.max(lastPage - 1, 0) }, (_, i) => i + 2);
+  const pageResults = await mapWithConcurrency(
+    remainingPages,
+    PAGE_FETCH_CONCURRENCY,
+    page => githubApiRequest(pageEndpoint(page), accessToken)
+  );
+  
+  for (const items of pageResults) {
+    if (allItems.length >= limit) break;
+    appendPage(items);
+  }
+  
+  return allItems;
+}
+
+/**
+ * Reduce a GitHub repository object to the fields the repository lists display
+ * @param {object} repo - Repository object from the GitHub API (~100 fields)
+ * @returns {object} Repository summary
+ */
+export function toRepositorySummary(repo) {
+  return {
+    id: repo.id,
+    name: repo.name,
+    full_name: repo.full_name,
+    private: repo.private,
+    description: repo.description,
+    language: repo.language,
+    created_at: repo.created_at,
+    updated_at: repo.updated_at
+  };
+}
+
+/**
+ * Load an analysis input through the short-lived per-user cache
+ * @param {string} kind - Input kind ('commits', 'pulls' or 'issues')
+ * @param {string} owner - Repository owner
+ * @param {string} repo - Repository name
+ * @param {string} accessToken - GitHub access token
+ * @param {object} dateRange - Date range options
+ * @param {function} loader - Fetches the input on a cache miss
+ * @returns {Promise<Array>} Cached or freshly fetched items (treat as read-only)
+ */
+function getCachedAnalysisInput(kind, owner, repo, accessToken, dateRange, loader) {
+  const { since, until } = dateRange;
+  // Owner and repo names are case-insensitive on GitHub; the token hash is not
+  const key = `${hashToken(accessToken)} ${kind} ${`${owner}/${repo}`.toLowerCase()} ${since ?? ''} ${until ?? ''}`;
+  
+  let pending = analysisInputCache.get(key);
+  if (!pending) {
+    pending = loader(owner, repo, accessToken, { since, until });
+    analysisInputCache.set(key, pending);
+    // Failures are not cached: the next request retries
+    pending.catch(() => analysisInputCache.delete(key));
+  }
+  return pending;
+}
+
+/**
+ * Reduce a REST commit object to the fields the analysis reads
+ * @param {object} commit - Commit object from the GitHub API (several KB)
+ * @returns {object} Commit summary in the same shape
+ */
+function toCommitSummary(commit) {
+  const author = commit.author;
+  return {
+    sha: commit.sha,
+    author: author ? { login: author.login, avatar_url: author.avatar_url, html_url: author.html_url } : null,
+    commit: { author: { name: commit.commit?.author?.name, date: commit.commit?.author?.date } }
+  };
+}
+
+/**
+ * Reduce a pull request object to the fields the analysis reads
+ * @param {object} pr - Pull request object from the GitHub API
+ * @returns {object} Pull request summary in the same shape
+ */
+function toPullRequestSummary(pr) {
+  return {
+    state: pr.state,
+    created_at: pr.created_at,
+    merged_at: pr.merged_at,
+    user: pr.user ? { login: pr.user.login } : null
+  };
+}
+
+/**
+ * Reduce an issue object to the fields the analysis reads
+ * @param {object} issue - Issue object from the GitHub API
+ * @returns {object} Issue summary in the same shape
+ */
+function toIssueSummary(issue) {
+  return {
+    state: issue.state,
+    created_at: issue.created_at,
+    pull_request: issue.pull_request ? {} : undefined
+  };
+}
+
+/**
+ * Fetch default-branch commits in a date range through the GraphQL API,
+ * returned in the REST shape (sha, author, commit.author) the analysis reads.
+ * GraphQL requires authentication, so this is only used with a token.
+ * @param {string} owner - Repository owner
+ * @param {string} repo - Repository name
+ * @param {string} accessToken - GitHub access token
+ * @param {object} dateRange - Date range options
+ * @returns {Promise<Array>} Commits data
+ */
+async function fetchCommitsGraphQL(owner, repo, accessToken, { since, until } = {}) {
+  const commits = [];
+  let cursor = null;
+  
+  for (let page = 1; ; page++) {
+    // Same safety limit as the REST walk
+    if (page > 50) {
+      logger.warn('Reached page limit (50) for GraphQL history of %s/%s', owner, repo);
+      break;
+    }
     
-    const items = await githubApiRequest(`${endpoint}?${queryParams}`, accessToken);
+    const { data: result } = await githubApiFetch('/graphql', accessToken, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        query: COMMIT_HISTORY_QUERY,
+        variables: { owner, repo, since: since ?? null, until: until ?? null, cursor }
+      })
+    });
     
-    if (!Array.isArray(items) || items.length === 0) {
-      break;
+    if (result.errors?.length) {
+      if (result.errors.some(e => e.type === 'NOT_FOUND')) {
+        throw new Error('Resource not found');
+      }
+      // An exhausted GraphQL quota can arrive as a 200 with a RATE_LIMITED error
+      if (result.errors.some(e => e.type === 'RATE_LIMITED')) {
+        throw new Error('GitHub API rate limit exceeded');
+      }
+      throw new Error(`GitHub GraphQL error: ${result.errors[0].message}`);
     }
     
-    allItems.push(...items);
+    // Empty repositories have no default branch
+    const history = result.data?.repository?.defaultBranchRef?.target?.history;
+    if (!history) break;
     
-    // Check limits
-    if (items.length < perPage) break; // Last page
-    if (maxItems > 0 && allItems.length >= maxItems) {
-      return allItems.slice(0, maxItems);
+    for (const node of history.nodes) {
+      const user = node.author?.user;
+      commits.push({
+        sha: node.oid,
+        author: user ? { login: user.login, avatar_url: user.avatarUrl, html_url: user.url } : null,
+        commit: { author: { name: node.author?.name, date: node.authoredDate } }
+      });
     }
     
-    page++;
+    if (!history.pageInfo.hasNextPage) break;
+    cursor = history.pageInfo.endCursor;
   }
   
-  return allItems;
+  return commits;
 }
 
 /**
- * Fetch commits with date filtering
+ * Load commits from GitHub with date filtering
  * @param {string} owner - Repository owner
  * @param {string} repo - Repository name
  * @param {string} accessToken - GitHub access token
  * @param {object} dateRange - Date range options
  * @returns {Promise<Array>} Commits data
  */
-export async function fetchCommits(owner, repo, accessToken, { since, until } = {}) {
+async function loadCommits(owner, repo, accessToken, { since, until } = {}) {
   const params = {};
   if (since) params.since = since;
   // Note: GitHub API doesn't support 'until' for commits, so we'll filter client-side
   
-  console.log(`Fetching commits for ${owner}/${repo} with params:`, params);
+  logger.debug('Fetching commits for %s/%s with params:', owner, repo, params);
   
   // Use smart pagination for until filtering to avoid fetching too much data
   let commits = [];
-  if (until) {
-    commits = await fetchPagesWithDateTermination(`/repos/${owner}/${repo}/commits`, accessToken, params, since, until, 'commit.author.date');
+  if (accessToken && (since || until)) {
+    // GraphQL filters both bounds server-side and transfers a fraction of the bytes
+    commits = await fetchCommitsGraphQL(owner, repo, accessToken, { since, until });
+  } else if (until) {
+    commits = (await fetchPagesWithDateTermination(`/repos/${owner}/${repo}/commits`, accessToken, params, since, until, 'commit.author.date'))
+      .map(toCommitSummary);
   } else {
-    commits = await fetchAllPages(`/repos/${owner}/${repo}/commits`, accessToken, params, 0); // 0 = no limit
+    commits = (await fetchAllPages(`/repos/${owner}/${repo}/commits`, accessToken, params, 0)) // 0 = no limit
+      .map(toCommitSummary);
   }
   
-  console.log(`Fetched ${commits.length} commits with smart pagination`);
+  logger.debug('Fetched %d commits with smart pagination', commits.length);
   return commits;
 }
 
 /**
- * Fetch pull requests with date filtering
+ * Fetch commits with date filtering
+ * @param {string} owner - Repository owner
+ * @param {string} repo - Repository name
+ * @param {string} accessToken - GitHub access token
+ * @param {object} dateRange - Date range options
+ * @returns {Promise<Array>} Commits data
+ */
+export function fetchCommits(owner, repo, accessToken, dateRange = {}) {
+  return getCachedAnalysisInput('commits', owner, repo, accessToken, dateRange, loadCommits);
+}
+
+/**
+ * Load pull requests from GitHub with date filtering
  * @param {string} owner - Repository owner
  * @param {string} repo - Repository name
  * @param {string} accessToken - GitHub access token
  * @param {object} dateRange - Date range options
  * @returns {Promise<Array>} Pull requests data
  */
-export async function fetchPullRequests(owner, repo, accessToken, { since, until } = {}) {
+async function loadPullRequests(owner, repo, accessToken, { since, until } = {}) {
   const params = {
     state: 'all',
     sort: 'created',
     direction: 'desc' // Get newest first for better filtering
   };
   
-  console.log(`Fetching PRs for ${owner}/${repo} with date range:`, { since, until });
+  logger.debug('Fetching PRs for %s/%s with date range:', owner, repo, { since, until });
   
   // For date-filtered requests, use smart pagination to avoid fetching entire history
   let prs = [];
@@ -209,19 +692,31 @@ export async function fetchPullRequests(owner, repo, accessToken, { since, until
     prs = await fetchAllPages(`/repos/${owner}/${repo}/pulls`, accessToken, params, 1000);
   }
   
-  console.log(`Fetched ${prs.length} PRs with smart pagination`);
-  return prs;
+  logger.debug('Fetched %d PRs with smart pagination', prs.length);
+  return prs.map(toPullRequestSummary);
 }
 
 /**
- * Fetch issues with date filtering
+ * Fetch pull requests with date filtering
+ * @param {string} owner - Repository owner
+ * @param {string} repo - Repository name
+ * @param {string} accessToken - GitHub access token
+ * @param {object} dateRange - Date range options
+ * @returns {Promise<Array>} Pull requests data
+ */
+export function fetchPullRequests(owner, repo, accessToken, dateRange = {}) {
+  return getCachedAnalysisInput('pulls', owner, repo, accessToken, dateRange, loadPullRequests);
+}
+
+/**
+ * Load issues from GitHub with date filtering
  * @param {string} owner - Repository owner
  * @param {string} repo - Repository name
  * @param {string} accessToken - GitHub access token
  * @param {object} dateRange - Date range options
  * @returns {Promise<Array>} Issues data
  */
-export async function fetchIssues(owner, repo, accessToken, { since, until } = {}) {
+async function loadIssues(owner, repo, accessToken, { since, until } = {}) {
   const params = { 
     state: 'all',
     sort: 'created',
@@ -237,6 +732,18 @@ export async function fetchIssues(owner, repo, accessToken, { since, until } = {
     issues = await fetchAllPages(`/repos/${owner}/${repo}/issues`, accessToken, params, 500);
   }
   
-  console.log(`Fetched ${issues.length} issues with smart pagination`);
-  return issues;
+  logger.debug('Fetched %d issues with smart pagination', issues.length);
+  return issues.map(toIssueSummary);
+}
+
+/**
+ * Fetch issues with date filtering
+ * @param {string} owner - Repository owner
+ * @param {string} repo - Repository name
+ * @param {string} accessToken - GitHub access token
+ * @param {object} dateRange - Date range options
+ * @returns {Promise<Array>} Issues data
+ */
+export function fetchIssues(owner, repo, accessToken, dateRange = {}) {
+  return getCachedAnalysisInput('issues', owner, repo, accessToken, dateRange, loadIssues);
 }
\ No newline at end of file
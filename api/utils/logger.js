@@ -0,0 +1,28 @@
+/**
+ * Level-gated logging utility
+ */
+
+const LEVELS = { debug: 10, info: 20, warn: 30, error: 40 };
+const noop = () => {};
+
+// Resolved once per instance so disabled levels cost a single no-op call
+const threshold = LEVELS[process.env.LOG_LEVEL] ?? LEVELS.info;
+
+/**
+ * Logger whose methods are no-ops below LOG_LEVEL (default: info)
+ */
+export const logger = {
+  debug: threshold <= LEVELS.debug ? console.log.bind(console) : noop,
+  info: threshold <= LEVELS.info ? console.log.bind(console) : noop,
+  warn: threshold <= LEVELS.warn ? console.warn.bind(console) : noop,
+  error: console.error.bind(console)
+};
+
+/**
+ * Check whether a level is logged, to skip building expensive log arguments
+ * @param {string} level - Level name ('debug', 'info', 'warn' or 'error')
+ * @returns {boolean} True if messages at this level are written
+ */
+export function isLevelEnabled(level) {
+  return threshold <= LEVELS[level];
+}
\ No newline at end of file
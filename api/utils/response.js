@@ -1,6 +1,7 @@
 /**
  * HTTP response utility functions
  */
+import { logger } from './logger.js';
 
 /**
  * Set CORS headers for API responses
@@ -38,7 +39,7 @@ export function handleCors(req, res) {
  */
 export function sendError(res, status, message, error = null) {
   if (error) {
-    console.error('API Error:', error);
+    logger.error('API Error:', error);
   }
   
   res.status(status).json({ 
@@ -73,8 +74,7 @@ export function asyncHandler(handler) {
     try {
       await handler(req, res);
     } catch (error) {
-      console.error('Unhandled error in API handler:', error);
-      
+      // Expected auth/lookup failures are not logged; only 500s reach sendError's logging
       if (error.message === 'Session ID not provided') {
         return sendError(res, 400, error.message);
       }
@@ -87,6 +87,10 @@ export function asyncHandler(handler) {
         return sendError(res, 401, error.message);
       }
       
+      if (error.message.includes('rate limit exceeded')) {
+        return sendError(res, 429, error.message);
+      }
+      
       if (error.message.includes('not found')) {
         return sendError(res, 404, error.message);
       }
@@ -4,7 +4,7 @@ import { apiCall, formatDate } from '../utils/api';
 import { Navigate, useNavigate } from 'react-router-dom';
 
 function Dashboard() {
-  const { isAuthenticated, user, logout, sessionId } = useAuth();
+  const { isAuthenticated, user, logout } = useAuth();
   const [repositories, setRepositories] = useState([]);
   
   // Debug user data
@@ -21,8 +21,8 @@ function Dashboard() {
       
       // Fetch both repositories and starred repos in parallel
       const [repos, starred] = await Promise.all([
-        apiCall(`/repositories?session_id=${sessionId}`),
-        apiCall(`/starred?session_id=${sessionId}`)
+        apiCall('/repositories'),
+        apiCall('/starred')
       ]);
       
       // Ensure repos is an array
@@ -46,17 +46,17 @@ function Dashboard() {
     } finally {
       setLoading(false);
     }
-  }, [sessionId]);
+  }, []);
 
   useEffect(() => {
-    if (isAuthenticated && sessionId) {
+    if (isAuthenticated) {
       fetchData();
     }
-  }, [isAuthenticated, sessionId, fetchData]);
+  }, [isAuthenticated, fetchData]);
 
   const handleRepositoryClick = (repo) => {
     const [owner, repoName] = repo.full_name.split('/');
-    navigate(`/repository/${owner}/${repoName}?session_id=${sessionId}`);
+    navigate(`/repository/${owner}/${repoName}`);
   };
 
   const handleLogout = async () => {
@@ -74,7 +74,7 @@ function Dashboard() {
         <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
           <div>
             <h1 style={{ margin: '0 0 8px 0', color: '#1f2937' }}>
-              Welcome back, {(user?.name && user.name !== 'None') ? user.name : user?.login || 'GitHub User'}!
+              Welcome back, {user?.name || user?.login || 'GitHub User'}!
             </h1>
             <p style={{ margin: 0, color: '#6b7280' }}>
               Select a repository to analyze
@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useCallback, useMemo } from 'react';
-import { useParams, useSearchParams, useNavigate } from 'react-router-dom';
+import { useParams, useNavigate } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
 import { useSSE } from '../hooks/useSSE';
 import { apiCall, getApiBaseUrl } from '../utils/api';
@@ -106,10 +106,8 @@ ChartJS.register(
 
 function RepositoryAnalysis() {
   const { owner, repo } = useParams();
-  const [searchParams] = useSearchParams();
   const navigate = useNavigate();
   const { isAuthenticated } = useAuth();
-  const sessionId = searchParams.get('session_id');
   
   const [analysis, setAnalysis] = useState(null);
   const [loading, setLoading] = useState(true);
@@ -290,18 +288,15 @@ function RepositoryAnalysis() {
 
   // SSE connection for streaming analysis with epoch timestamps - memoized to prevent infinite re-renders
   const sseUrl = useMemo(() => {
-    if (!sessionId) return null;
-    
     const baseUrl = `${getApiBaseUrl()}/api/repository/${owner}/${repo}/analysis/stream`;
     
     const params = new URLSearchParams({
-      session_id: sessionId,
       start_epoch: epochRange.start_epoch.toString(),
       end_epoch: epochRange.end_epoch.toString()
     });
     
     return `${baseUrl}?${params.toString()}`;
-  }, [owner, repo, sessionId, epochRange]);
+  }, [owner, repo, epochRange]);
 
   // Create stable callback functions using useCallback
   const onProgress = useCallback((progressData) => {
@@ -336,8 +331,7 @@ function RepositoryAnalysis() {
       setProgress({ step: 'starting', message: 'Loading repository analysis...', progress: 0 });
       
       const params = new URLSearchParams({
-        session_id: sessionId,
-        start_epoch: epochRange.start_epoch.toString(),
+          start_epoch: epochRange.start_epoch.toString(),
         end_epoch: epochRange.end_epoch.toString()
       });
       
@@ -352,7 +346,7 @@ function RepositoryAnalysis() {
     } finally {
       setLoading(false);
     }
-  }, [owner, repo, sessionId, epochRange]);
+  }, [owner, repo, epochRange]);
 
   const { data: streamData, error: streamError, isConnected, connect, disconnect, reset } = useSSE(useStreaming ? sseUrl : null, {
     onProgress,
@@ -361,7 +355,7 @@ function RepositoryAnalysis() {
   });
 
   useEffect(() => {
-    if (isAuthenticated && sessionId) {
+    if (isAuthenticated) {
       if (useStreaming && sseUrl) {
         setLoading(true);
         setError(null);
@@ -379,7 +373,7 @@ function RepositoryAnalysis() {
         disconnect();
       }
     };
-  }, [owner, repo, sessionId, isAuthenticated, quarterFilter, useStreaming, sseUrl, connect, disconnect, reset, fetchAnalysis]);
+  }, [owner, repo, isAuthenticated, quarterFilter, useStreaming, sseUrl, connect, disconnect, reset, fetchAnalysis]);
 
   // Auto-disconnect when analysis is complete
   useEffect(() => {
@@ -389,7 +383,7 @@ function RepositoryAnalysis() {
   }, [analysis, loading, disconnect]);
 
 
-  if (!isAuthenticated || !sessionId) {
+  if (!isAuthenticated) {
     navigate('/');
     return null;
   }
@@ -548,7 +542,7 @@ function RepositoryAnalysis() {
           </div>
         </div>
         <button 
-          onClick={() => navigate(`/dashboard?session_id=${sessionId}`)}
+          onClick={() => navigate('/dashboard')}
           className="button button-secondary"
         >
           Back to Dashboard
@@ -644,7 +638,7 @@ function RepositoryAnalysis() {
             )}
           </div>
           <button 
-            onClick={() => navigate(`/dashboard?session_id=${sessionId}`)}
+            onClick={() => navigate('/dashboard')}
             className="button button-secondary"
           >
             Back to Dashboard
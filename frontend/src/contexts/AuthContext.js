@@ -13,45 +13,21 @@ export function useAuth() {
 
 export function AuthProvider({ children }) {
   const [user, setUser] = useState(null);
-  const [sessionId, setSessionId] = useState(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    
-    const urlParams = new URLSearchParams(window.location.search);
-    const sessionFromUrl = urlParams.get('session');
-    
-    
-    if (sessionFromUrl) {
-      setSessionId(sessionFromUrl);
-      // Clean up the URL
-      window.history.replaceState({}, document.title, window.location.pathname);
-      checkSession(sessionFromUrl);
-    } else {
-      const savedSession = localStorage.getItem('github_session');
-      if (savedSession) {
-        setSessionId(savedSession);
-        checkSession(savedSession);
-      } else {
-        setLoading(false);
-      }
-    }
+    // The session lives in an HttpOnly cookie, so ask the API who we are
+    checkSession();
   }, []);
 
-  const checkSession = async (session) => {
+  const checkSession = async () => {
     try {
-      const userData = await apiCall(`/auth/user?session_id=${session}`);
+      const userData = await apiCall('/auth/user');
       setUser(userData);
-      localStorage.setItem('github_session', session);
-      setLoading(false);
     } catch (error) {
-      // Check if it's a 401/auth error
-      if (error.message.includes('Session expired') || error.message.includes('401')) {
-        localStorage.removeItem('github_session');
-        setSessionId(null);
-        setUser(null);
-      }
-      
+      // No session cookie, or it has expired
+      setUser(null);
+    } finally {
       setLoading(false);
     }
   };
@@ -67,25 +43,22 @@ export function AuthProvider({ children }) {
 
   const logout = async () => {
     try {
-      if (sessionId) {
-        await apiCall('/auth/logout', 'POST', { session_id: sessionId });
-      }
+      await apiCall('/auth/logout', 'POST');
     } catch (error) {
       // Ignore logout errors
     } finally {
-      localStorage.removeItem('github_session');
-      setSessionId(null);
       setUser(null);
     }
   };
 
   const handleAuthError = () => {
-    localStorage.removeItem('github_session');
-    setSessionId(null);
     setUser(null);
     setLoading(false);
-    // Redirect to login page
-    window.location.href = '/';
+    // Redirect to login page; the session check on load also lands here for
+    // signed-out visitors, so don't reload the login page itself
+    if (window.location.pathname !== '/') {
+      window.location.href = '/';
+    }
   };
 
   // Set up the auth error handler when the context is created
@@ -95,11 +68,10 @@ export function AuthProvider({ children }) {
 
   const value = {
     user,
-    sessionId,
     login,
     logout,
     loading,
-    isAuthenticated: !!user && !!sessionId
+    isAuthenticated: !!user
   };
 
   return (